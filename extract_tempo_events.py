@@ -3,11 +3,38 @@
 
 from __future__ import annotations
 
+import argparse
+import sys
+from array import array
+from itertools import accumulate
 from pathlib import Path
-from typing import Iterable
+from typing import TYPE_CHECKING, Callable, Iterator, Sequence
 
-import mido
-from tempo_to_sysex import build_sysex_message
+from tempo_to_sysex import tempo_to_sysex_hex as sysex_hex_for_tempo
+
+if TYPE_CHECKING:
+    import mido
+
+# Tempo in microseconds per beat assumed until the first set_tempo (120 BPM).
+DEFAULT_TEMPO = 500_000
+
+# Number of output lines buffered before each write to stdout.
+OUTPUT_BATCH_SIZE = 1024
+
+
+def validate_midi_path(raw: str) -> Path:
+    """Return the MIDI file path for raw input, raising ValueError if unusable."""
+    if not raw:
+        raise ValueError("Path can't be empty.")
+
+    path = Path(raw).expanduser()
+    if not path.exists():
+        raise ValueError(f"File '{path}' does not exist.")
+
+    if not path.is_file():
+        raise ValueError(f"'{path}' is not a file.")
+
+    return path
 
 
 def prompt_midi_path() -> Path:
@@ -18,74 +45,164 @@ def prompt_midi_path() -> Path:
         except EOFError:
             raise SystemExit("No input provided. Exiting.")
 
-        if not raw:
-            print("Path can't be empty. Try again.")
-            continue
-
-        path = Path(raw).expanduser()
-        if not path.exists():
-            print(f"File '{path}' does not exist. Try again.")
-            continue
+        try:
+            return validate_midi_path(raw)
+        except ValueError as exc:
+            print(f"{exc} Try again.")
 
-        if not path.is_file():
-            print(f"'{path}' is not a file. Try again.")
-            continue
 
-        return path
+def resolve_midi_path(parser: argparse.ArgumentParser, raw: str | None) -> Path:
+    """Return the MIDI path from the command line, prompting only on a terminal."""
+    if raw is not None:
+        try:
+            return validate_midi_path(raw.strip())
+        except ValueError as exc:
+            parser.error(str(exc))
+
+    if not sys.stdin.isatty():
+        parser.error("--midi is required when stdin is not a terminal.")
+
+    return prompt_midi_path()
+
+
+def _collect_tempo_changes(mid: mido.MidiFile) -> tuple[list[int], list[int], int]:
+    """Walk all tracks once for set_tempo events and the overall end tick.
+
+    Returns parallel lists of absolute ticks and tempos, plus the tick at which
+    the longest track ends.
+    """
+    tempo_changes: list[tuple[int, int]] = []
+    total_ticks = 0
+    for track in mid.tracks:
+        tick = 0
+        for message in track:
+            tick += message.time
+            if message.type != "set_tempo":
+                continue
+            tempo_changes.append((tick, message.tempo))
+        total_ticks = max(total_ticks, tick)
+
+    # Tempo changes may live on any track; order them on a shared timeline.
+    tempo_changes.sort(key=lambda change: change[0])
+
+    ticks = [tick for tick, _ in tempo_changes]
+    tempos = [tempo for _, tempo in tempo_changes]
+    return ticks, tempos, total_ticks
+
+
+def _tempo_change_seconds(
+    ticks: list[int],
+    tempos: list[int],
+    ticks_per_beat: int,
+    tick2second: Callable[[int, int, int], float],
+) -> array[float]:
+    """Convert absolute tempo-change ticks to elapsed seconds.
+
+    Each gap between changes is timed at the tempo in force before it, so the
+    elapsed time is a running sum over piecewise-constant tempo segments.
+    """
+    previous_ticks = [0, *ticks[:-1]]
+    segment_tempos = [DEFAULT_TEMPO, *tempos[:-1]]
+    segment_seconds = (
+        tick2second(tick - previous, ticks_per_beat, tempo)
+        for tick, previous, tempo in zip(ticks, previous_ticks, segment_tempos)
+    )
+    return array("d", accumulate(segment_seconds))
+
+
+def tempo_event_arrays(
+    mid: mido.MidiFile,
+    tick2second: Callable[[int, int, int], float],
+    tempo2bpm: Callable[[int], float],
+) -> tuple[array[float], array[float], float]:
+    """Return parallel seconds/BPM arrays of tempo events and the file's duration.
+
+    Tracks are walked directly rather than through mido's merged playback
+    iterator, so only ``set_tempo`` messages are converted to seconds. The
+    duration comes from the same scan, avoiding the second full pass that
+    reading ``mid.length`` would trigger.
+
+    ``tick2second`` and ``tempo2bpm`` are mido's converters, passed in by the
+    caller so this module only imports mido where it is actually used.
+    """
+    ticks, tempos, total_ticks = _collect_tempo_changes(mid)
+    ticks_per_beat = mid.ticks_per_beat
+    seconds = _tempo_change_seconds(ticks, tempos, ticks_per_beat, tick2second)
+    bpms = array("d", map(tempo2bpm, tempos))
+
+    last_tick = ticks[-1] if ticks else 0
+    last_seconds = seconds[-1] if seconds else 0.0
+    last_tempo = tempos[-1] if tempos else DEFAULT_TEMPO
+    duration = last_seconds + tick2second(
+        total_ticks - last_tick, ticks_per_beat, last_tempo
+    )
+    return seconds, bpms, duration
 
 
-def iter_tempo_events(mid: mido.MidiFile) -> Iterable[tuple[float, float]]:
-    """Yield (elapsed_seconds, bpm) for each tempo event in the MIDI file."""
-    elapsed_seconds = 0.0
-    for message in mid:
-        elapsed_seconds += message.time
-        if message.type == "set_tempo":
-            bpm = mido.tempo2bpm(message.tempo)
-            yield elapsed_seconds, bpm
+def iter_tempo_events(
+    mid: mido.MidiFile,
+    tick2second: Callable[[int, int, int], float],
+    tempo2bpm: Callable[[int], float],
+) -> Iterator[tuple[float, float]]:
+    """Return an iterator of (elapsed_seconds, bpm) for each tempo event."""
+    seconds, bpms, _ = tempo_event_arrays(mid, tick2second, tempo2bpm)
+    return zip(seconds, bpms)
 
 
 def format_timestamp(seconds: float) -> str:
     """Format seconds as mm.ss.milliseconds."""
-    minutes = int(seconds // 60)
-    remaining_seconds = seconds - minutes * 60
-    sec = int(remaining_seconds)
-    milliseconds = int(round((remaining_seconds - sec) * 1000))
-
-    if milliseconds == 1000:
-        milliseconds = 0
-        sec += 1
-        if sec == 60:
-            sec = 0
-            minutes += 1
-
+    total_milliseconds = int(round(seconds * 1000))
+    minutes, remaining_ms = divmod(total_milliseconds, 60_000)
+    sec, milliseconds = divmod(remaining_ms, 1000)
     return f"{minutes:02d}:{sec:02d}.{milliseconds:03d}"
 
 
 def tempo_to_sysex_hex(bpm: float) -> str:
     """Convert a BPM value to a SysEx message string."""
-    tempo = int(round(bpm))
-    message = build_sysex_message(tempo)
-    return " ".join(f"{byte:02X}" for byte in message)
+    return sysex_hex_for_tempo(int(round(bpm)))
 
 
-def main() -> None:
-    midi_path = prompt_midi_path()
-    midi_file = mido.MidiFile(midi_path)
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--midi", help="path to the MIDI file; prompted if omitted")
+    return parser
 
-    tempo_events = list(iter_tempo_events(midi_file))
-    total_tempo_events = len(tempo_events)
 
-    if not tempo_events:
-        print("No tempo events found in the provided MIDI file.")
-        print("Tempo events: 0, Output lines: 0 (OK)")
-        return
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    midi_path = resolve_midi_path(parser, args.midi)
+
+    # mido is imported only after the prompt so it doesn't delay startup.
+    import mido
 
+    midi_file = mido.MidiFile(midi_path, clip=True)
+    event_seconds, event_bpms, _ = tempo_event_arrays(
+        midi_file, mido.tick2second, mido.tempo2bpm
+    )
+    # Only the tempo events are needed from here on; free the parsed file.
+    del midi_file
+
+    # Event lines are written in batches rather than one print per event.
+    total_tempo_events = 0
     output_lines = 0
-    for elapsed_seconds, bpm in tempo_events:
+    lines: list[str] = []
+    for elapsed_seconds, bpm in zip(event_seconds, event_bpms):
+        total_tempo_events += 1
         timestamp = format_timestamp(elapsed_seconds)
         sysex_hex = tempo_to_sysex_hex(bpm)
-        print(f"[midi@{timestamp}: SX{sysex_hex}]")
+        lines.append(f"[midi@{timestamp}: SX{sysex_hex}]")
         output_lines += 1
+        if len(lines) >= OUTPUT_BATCH_SIZE:
+            sys.stdout.write("\n".join(lines) + "\n")
+            lines.clear()
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    if output_lines == 0:
+        print("No tempo events found in the provided MIDI file.")
+        print("Tempo events: 0, Output lines: 0 (OK)")
+        return
 
     status = "OK" if output_lines == total_tempo_events else "MISMATCH"
     print(
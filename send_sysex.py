@@ -3,16 +3,29 @@
 
 from __future__ import annotations
 
+import argparse
 import sys
-from typing import Iterable
+from functools import lru_cache
+from typing import Iterable, Sequence
 
 import mido
 
 
+@lru_cache(maxsize=1)
+def _get_ports_cached() -> tuple[str, ...]:
+    """Enumerate MIDI output port names once and cache the result."""
+    return tuple(mido.get_output_names())
+
+
+def invalidate_ports_cache() -> None:
+    """Forget cached port names so the next lookup re-enumerates devices."""
+    _get_ports_cached.cache_clear()
+
+
 def list_output_ports() -> list[str]:
     """Return available MIDI output port names."""
     try:
-        return mido.get_output_names()
+        return list(_get_ports_cached())
     except ModuleNotFoundError as exc:
         raise RuntimeError(
             "Mido requires the 'python-rtmidi' package for MIDI output. "
@@ -50,9 +63,38 @@ def prompt_port_choice(ports: list[str]) -> str:
         return ports[choice - 1]
 
 
-def parse_sysex_input(raw_message: str) -> list[int]:
-    """Parse a textual SysEx message into a list of integer bytes."""
+def resolve_port(
+    parser: argparse.ArgumentParser, port_name: str | None, ports: list[str]
+) -> str:
+    """Return the output port from the command line, prompting only on a terminal."""
+    if port_name is not None:
+        if port_name not in ports:
+            parser.error(
+                f"Unknown MIDI output port '{port_name}'. "
+                f"Available ports: {', '.join(ports)}"
+            )
+        return port_name
+
+    if not sys.stdin.isatty():
+        parser.error("--port is required when stdin is not a terminal.")
+
+    return prompt_port_choice(ports)
+
+
+def parse_sysex_input(raw_message: str) -> bytes:
+    """Parse a textual SysEx message into its raw bytes."""
     sanitized = raw_message.replace(",", " ")
+
+    # Clean two-digit hex pairs are decoded in one C call; anything else
+    # (0x prefixes, single-digit tokens) goes through the token parser below.
+    try:
+        fast_bytes = bytes.fromhex(sanitized)
+    except ValueError:
+        pass
+    else:
+        if fast_bytes:
+            return fast_bytes
+
     tokens = sanitized.split()
 
     # Allow inputs without whitespace by falling back to pairs
@@ -62,17 +104,28 @@ def parse_sysex_input(raw_message: str) -> list[int]:
             raise ValueError("SysEx message must have an even number of hex digits.")
         tokens = [stripped[i : i + 2] for i in range(0, len(stripped), 2)]
 
-    bytes_out: list[int] = []
+    hex_tokens: list[str] = []
     for token in tokens:
         token = token.lower()
         if token.startswith("0x"):
             token = token[2:]
         if not token:
             raise ValueError("Empty token in SysEx message.")
-        value = int(token, 16)
-        if not 0 <= value <= 0xFF:
-            raise ValueError(f"SysEx byte '{token}' is out of range 00-FF.")
-        bytes_out.append(value)
+        hex_tokens.append(token)
+
+    values = [int(token, 16) for token in hex_tokens]
+
+    # bytes() range-checks every value in one C pass; only on failure do we
+    # look for the offending token to report it.
+    try:
+        bytes_out = bytes(values)
+    except ValueError:
+        token = next(
+            token
+            for token, value in zip(hex_tokens, values)
+            if not 0 <= value <= 0xFF
+        )
+        raise ValueError(f"SysEx byte '{token}' is out of range 00-FF.") from None
 
     if not bytes_out:
         raise ValueError("SysEx message cannot be empty.")
@@ -80,8 +133,8 @@ def parse_sysex_input(raw_message: str) -> list[int]:
     return bytes_out
 
 
-def prompt_sysex_message() -> list[int]:
-    """Prompt the user for a SysEx message and return it as integer bytes."""
+def prompt_sysex_message() -> bytes:
+    """Prompt the user for a SysEx message and return its raw bytes."""
     while True:
         try:
             raw = input(
@@ -103,9 +156,23 @@ def prompt_sysex_message() -> list[int]:
         return message
 
 
-def prepare_sysex_payload(bytes_in: Iterable[int]) -> list[int]:
+def resolve_sysex(parser: argparse.ArgumentParser, raw: str | None) -> bytes:
+    """Return the SysEx bytes from the command line, prompting only on a terminal."""
+    if raw is not None:
+        try:
+            return parse_sysex_input(raw)
+        except ValueError as exc:
+            parser.error(f"Invalid SysEx message: {exc}")
+
+    if not sys.stdin.isatty():
+        parser.error("--sysex is required when stdin is not a terminal.")
+
+    return prompt_sysex_message()
+
+
+def prepare_sysex_payload(bytes_in: Iterable[int]) -> bytes:
     """Normalize SysEx bytes for mido by stripping F0/F7 if present."""
-    data = list(bytes_in)
+    data = bytes(bytes_in)
 
     if data[0] == 0xF0:
         data = data[1:]
@@ -115,18 +182,59 @@ def prepare_sysex_payload(bytes_in: Iterable[int]) -> list[int]:
     return data
 
 
-def send_sysex(port_name: str, sysex_bytes: list[int]) -> None:
+class SysexSender:
+    """Send SysEx messages through a single, reused MIDI output port.
+
+    The port is opened on entering the context and closed on exit, so any
+    number of messages can be sent without reopening the driver handle.
+    """
+
+    def __init__(self, port_name: str) -> None:
+        self.port_name = port_name
+        self._port: mido.ports.BaseOutput | None = None
+
+    def __enter__(self) -> SysexSender:
+        self._port = mido.open_output(self.port_name)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._port is not None:
+            self._port.close()
+            self._port = None
+
+    def send(self, sysex_bytes: Iterable[int]) -> None:
+        """Send the SysEx message through the open output port."""
+        if self._port is None:
+            raise RuntimeError("SysexSender must be used as a context manager.")
+
+        payload = prepare_sysex_payload(sysex_bytes)
+        if not payload:
+            raise ValueError("SysEx payload is empty after removing F0/F7 markers.")
+
+        self._port.send(mido.Message("sysex", data=payload))
+
+
+def send_sysex(port_name: str, sysex_bytes: bytes) -> None:
     """Send the SysEx message to the specified output port."""
-    payload = prepare_sysex_payload(sysex_bytes)
-    if not payload:
-        raise ValueError("SysEx payload is empty after removing F0/F7 markers.")
+    with SysexSender(port_name) as sender:
+        sender.send(sysex_bytes)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", help="MIDI output port name; prompted if omitted")
+    parser.add_argument(
+        "--sysex",
+        help="SysEx message bytes in hex, e.g. 'F0 00 01 74 11 14 78 00 6A F7'; "
+        "prompted if omitted",
+    )
+    return parser
 
-    message = mido.Message("sysex", data=payload)
-    with mido.open_output(port_name) as port:
-        port.send(message)
 
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = build_parser()
+    args = parser.parse_args(argv)
 
-def main() -> None:
     try:
         ports = list_output_ports()
     except RuntimeError as exc:
@@ -136,8 +244,8 @@ def main() -> None:
         print("No MIDI output ports available.")
         sys.exit(1)
 
-    port_name = prompt_port_choice(ports)
-    sysex_bytes = prompt_sysex_message()
+    port_name = resolve_port(parser, args.port, ports)
+    sysex_bytes = resolve_sysex(parser, args.sysex)
 
     try:
         send_sysex(port_name, sysex_bytes)
@@ -148,7 +256,7 @@ def main() -> None:
         print(f"Cannot send SysEx: {exc}")
         sys.exit(1)
 
-    hex_repr = " ".join(f"{byte:02X}" for byte in sysex_bytes)
+    hex_repr = sysex_bytes.hex(" ").upper()
     print(f"Sent SysEx to '{port_name}': {hex_repr}")
 
 
@@ -1,14 +1,38 @@
 #!/usr/bin/env python3
-"""Prompt for a tempo and print the corresponding SysEx message."""
+"""Take a tempo and print the corresponding SysEx message."""
 
 from __future__ import annotations
 
+import argparse
+import sys
 from functools import reduce
+from operator import xor
 from typing import Sequence
 
 MIN_TEMPO = 10
 MAX_TEMPO = 255
 
+# Start-of-SysEx plus the fixed header bytes of every tempo message, and their
+# XOR, folded once so only the tempo bytes are mixed into each checksum.
+_SYSEX_HEADER = (0xF0, 0x00, 0x01, 0x74, 0x11, 0x14)
+_SYSEX_HEADER_XOR = reduce(xor, _SYSEX_HEADER)
+
+
+def parse_tempo(raw: str) -> int:
+    """Parse and validate a tempo, raising ValueError if it is unusable."""
+    if not raw:
+        raise ValueError("Tempo can't be empty.")
+
+    try:
+        tempo = int(raw)
+    except ValueError:
+        raise ValueError("Please enter a whole number.") from None
+
+    if not (MIN_TEMPO <= tempo <= MAX_TEMPO):
+        raise ValueError(f"Tempo must be between {MIN_TEMPO} and {MAX_TEMPO}.")
+
+    return tempo
+
 
 def read_tempo() -> int:
     """Prompt the user until a valid tempo integer is entered."""
@@ -18,21 +42,24 @@ def read_tempo() -> int:
         except EOFError:
             raise SystemExit("No input provided. Exiting.")
 
-        if not raw:
-            print("Tempo can't be empty. Try again.")
-            continue
+        try:
+            return parse_tempo(raw)
+        except ValueError as exc:
+            print(f"{exc} Try again.")
+
 
+def resolve_tempo(parser: argparse.ArgumentParser, raw: str | None) -> int:
+    """Return the tempo from the command line, prompting only on a terminal."""
+    if raw is not None:
         try:
-            tempo = int(raw)
-        except ValueError:
-            print("Please enter a whole number.")
-            continue
+            return parse_tempo(raw.strip())
+        except ValueError as exc:
+            parser.error(str(exc))
 
-        if not (MIN_TEMPO <= tempo <= MAX_TEMPO):
-            print(f"Tempo must be between {MIN_TEMPO} and {MAX_TEMPO}.")
-            continue
+    if not sys.stdin.isatty():
+        parser.error("--tempo is required when stdin is not a terminal.")
 
-        return tempo
+    return read_tempo()
 
 
 def tempo_to_sysex_bytes(tempo: int) -> tuple[int, int]:
@@ -42,27 +69,43 @@ def tempo_to_sysex_bytes(tempo: int) -> tuple[int, int]:
     return lsb, msb
 
 
-def calculate_checksum(data: Sequence[int]) -> int:
-    """Calculate the 7-bit XOR checksum for the provided data bytes."""
-    if not data:
-        raise ValueError("Checksum requires at least one byte of data.")
+def build_sysex_message(tempo: int) -> bytes:
+    """Build the SysEx message for the given tempo, including checksum."""
+    lsb, msb = tempo_to_sysex_bytes(tempo)
+    checksum = (_SYSEX_HEADER_XOR ^ lsb ^ msb) & 0x7F
+    return bytes((*_SYSEX_HEADER, lsb, msb, checksum, 0xF7))
+
 
-    xor_result = reduce(lambda x, y: x ^ y, data)
-    return xor_result & 0x7F
+def _build_sysex_hex(tempo: int) -> str:
+    """Build the space-separated hex string for the given tempo's SysEx."""
+    return build_sysex_message(tempo).hex(" ").upper()
 
 
-def build_sysex_message(tempo: int) -> list[int]:
-    """Build the SysEx message for the given tempo, including checksum."""
-    lsb, msb = tempo_to_sysex_bytes(tempo)
-    body = [0xF0, 0x00, 0x01, 0x74, 0x11, 0x14, lsb, msb]
-    checksum = calculate_checksum(body)
-    return body + [checksum, 0xF7]
+# Every tempo up to MAX_TEMPO has its hex string built once at import time.
+SYSEX_HEX_BY_TEMPO = [_build_sysex_hex(tempo) for tempo in range(MAX_TEMPO + 1)]
+
+
+def tempo_to_sysex_hex(tempo: int) -> str:
+    """Return the space-separated hex string of the SysEx for the given tempo."""
+    if 0 <= tempo <= MAX_TEMPO:
+        return SYSEX_HEX_BY_TEMPO[tempo]
+    return _build_sysex_hex(tempo)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--tempo", help=f"tempo in BPM ({MIN_TEMPO}-{MAX_TEMPO}); prompted if omitted"
+    )
+    return parser
+
 
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = build_parser()
+    args = parser.parse_args(argv)
 
-def main() -> None:
-    tempo = read_tempo()
-    message = build_sysex_message(tempo)
-    hex_message = " ".join(f"{byte:02X}" for byte in message)
+    tempo = resolve_tempo(parser, args.tempo)
+    hex_message = tempo_to_sysex_hex(tempo)
     print(f"Tempo {tempo} -> SysEx message: {hex_message}")
 
 
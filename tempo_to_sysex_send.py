@@ -1,15 +1,29 @@
 #!/usr/bin/env python3
-"""Prompt for a tempo, build the SysEx message, and send it to a MIDI port."""
+"""Take a tempo, build the SysEx message, and send it to a MIDI port."""
 
 from __future__ import annotations
 
+import argparse
 import sys
+from typing import Sequence
 
-from tempo_to_sysex import build_sysex_message, read_tempo
-from send_sysex import list_output_ports, prompt_port_choice, send_sysex
+from tempo_to_sysex import MAX_TEMPO, MIN_TEMPO, build_sysex_message, resolve_tempo
+from send_sysex import SysexSender, list_output_ports, resolve_port
 
 
-def main() -> None:
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--tempo", help=f"tempo in BPM ({MIN_TEMPO}-{MAX_TEMPO}); prompted if omitted"
+    )
+    parser.add_argument("--port", help="MIDI output port name; prompted if omitted")
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
     try:
         ports = list_output_ports()
     except RuntimeError as exc:
@@ -20,15 +34,16 @@ def main() -> None:
         print("No MIDI output ports available.")
         sys.exit(1)
 
-    tempo = read_tempo()
+    tempo = resolve_tempo(parser, args.tempo)
     message = build_sysex_message(tempo)
-    hex_repr = " ".join(f"{byte:02X}" for byte in message)
+    hex_repr = message.hex(" ").upper()
     print(f"Tempo {tempo} -> SysEx message: {hex_repr}")
 
-    port_name = prompt_port_choice(ports)
+    port_name = resolve_port(parser, args.port, ports)
 
     try:
-        send_sysex(port_name, message)
+        with SysexSender(port_name) as sender:
+            sender.send(message)
     except (IOError, OSError) as exc:
         print(f"Failed to open '{port_name}': {exc}")
         sys.exit(1)